@@ -7,11 +7,20 @@ Author: Blue (Senior Software Engineer)
 License: MIT
 """
 
-import pygame
 import random
 import sys
-from dataclasses import dataclass
-from typing import Tuple
+import time
+from typing import Dict, Tuple
+
+import pygame
+from pygame import K_DOWN, K_UP, K_p, K_q, K_r, K_s, K_w, KEYDOWN, QUIT
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the AI math runs as plain Python without it
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        return lambda func: func
 
 # Constants
 SCREEN_WIDTH = 800
@@ -33,36 +42,118 @@ BALL_BASE_SPEED = 5
 SPEED_INCREMENT = 0.5
 WINNING_SCORE = 10
 
+# Ball state is 16.16 fixed point: pixel value = raw >> FIXED_SHIFT
+FIXED_SHIFT = 16
+FIXED_ONE = 1 << FIXED_SHIFT
+BALL_MIN_Y_Q = (BALL_SIZE//2) << FIXED_SHIFT
+BALL_MAX_Y_Q = (SCREEN_HEIGHT - BALL_SIZE//2) << FIXED_SHIFT
+
+# Shared RNG so hot paths call bound methods instead of module lookups
+_RNG = random.Random()
+
+# Window events after which the whole screen must be repainted, since only
+# dirty rects are presented during play (VIDEOEXPOSE covers pygame 2.0)
+_REDRAW_EVENTS = tuple(
+    getattr(pygame, name)
+    for name in ("VIDEOEXPOSE", "WINDOWEXPOSED", "WINDOWRESTORED", "WINDOWFOCUSGAINED")
+    if hasattr(pygame, name)
+)
+
+# Every event type the game handles; all others are blocked at the SDL level
+_ALLOWED_EVENTS = (QUIT, KEYDOWN) + _REDRAW_EVENTS
+
+
+# Explicit signature so numba compiles at import, not mid-rally on first use.
+# The collision/goal logic in Game.update stays in Python: it is a few
+# integer comparisons on object state plus calls into hit/score handlers,
+# so numba's per-call dispatch and argument unboxing would cost more than it saves.
+@njit("f8(f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _ai_step(paddle_y: float, ball_y: float, speed: float,
+             rand_err: float, rand_scale: float) -> float:
+    """Return the AI paddle's next y given pre-sampled randomness."""
+    target_y = ball_y - PADDLE_HEIGHT // 2 + rand_err
+    current_speed = speed * rand_scale
+    if paddle_y < target_y - 5:
+        return min(SCREEN_HEIGHT - PADDLE_HEIGHT, paddle_y + current_speed)
+    if paddle_y > target_y + 5:
+        return max(0.0, paddle_y - current_speed)
+    return paddle_y
+
 
-@dataclass
 class Ball:
-    """Represents the game ball with position and velocity."""
-    x: float
-    y: float
-    vx: float
-    vy: float
+    """Represents the game ball with position and velocity.
+    
+    State is stored as 16.16 fixed-point integers so movement is integer
+    addition and the pixel position is a shift, with no float truncation
+    per frame. The x/y/vx/vy properties expose it in pixel units.
+    """
+    __slots__ = ("x_q", "y_q", "vx_q", "vy_q", "rect")
 
-    def get_rect(self) -> pygame.Rect:
-        """Get the ball's rectangle for collision detection."""
-        return pygame.Rect(self.x - BALL_SIZE//2, self.y - BALL_SIZE//2, BALL_SIZE, BALL_SIZE)
+    def __init__(self, x: float, y: float, vx: float, vy: float):
+        self.x_q = int(x * FIXED_ONE)
+        self.y_q = int(y * FIXED_ONE)
+        self.vx_q = int(vx * FIXED_ONE)
+        self.vy_q = int(vy * FIXED_ONE)
+        self.rect = pygame.Rect(0, 0, BALL_SIZE, BALL_SIZE)
+
+    def __repr__(self) -> str:
+        return f"Ball(x={self.x}, y={self.y}, vx={self.vx}, vy={self.vy})"
+
+    @property
+    def x(self) -> int:
+        """Horizontal position in whole pixels."""
+        return self.x_q >> FIXED_SHIFT
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self.x_q = int(value * FIXED_ONE)
+
+    @property
+    def y(self) -> int:
+        """Vertical position in whole pixels."""
+        return self.y_q >> FIXED_SHIFT
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self.y_q = int(value * FIXED_ONE)
 
-    def move(self) -> None:
-        """Update ball position based on velocity."""
-        self.x += self.vx
-        self.y += self.vy
+    @property
+    def vx(self) -> float:
+        """Horizontal velocity in pixels per frame."""
+        return self.vx_q / FIXED_ONE
+
+    @vx.setter
+    def vx(self, value: float) -> None:
+        self.vx_q = int(value * FIXED_ONE)
+
+    @property
+    def vy(self) -> float:
+        """Vertical velocity in pixels per frame."""
+        return self.vy_q / FIXED_ONE
+
+    @vy.setter
+    def vy(self, value: float) -> None:
+        self.vy_q = int(value * FIXED_ONE)
+
+    def get_rect(self) -> pygame.Rect:
+        """Get the ball's cached rectangle, moved to its current position, for drawing."""
+        self.rect.x = (self.x_q >> FIXED_SHIFT) - BALL_SIZE//2
+        self.rect.y = (self.y_q >> FIXED_SHIFT) - BALL_SIZE//2
+        return self.rect
 
     def reset(self, direction: int) -> None:
         """Reset ball to center with initial velocity."""
         self.x = SCREEN_WIDTH // 2
         self.y = SCREEN_HEIGHT // 2
-        speed = BALL_BASE_SPEED + random.uniform(0, 2)
-        angle = random.uniform(-45, 45)
-        self.vx = direction * speed * random.choice([0.8, 1.0, 1.2])
-        self.vy = speed * random.choice([-1, 1]) * random.uniform(0.5, 1.0)
+        rand = _RNG.random
+        speed = BALL_BASE_SPEED + 2 * rand()
+        self.vx = direction * speed * (0.8, 1.0, 1.2)[_RNG.randrange(3)]
+        self.vy = speed * (-1, 1)[_RNG.randrange(2)] * (0.5 + 0.5 * rand())
 
 
 class Paddle:
     """Represents a paddle with position and AI behavior."""
+    __slots__ = ("x", "y", "is_ai", "speed", "reaction_delay", "rect")
     
     def __init__(self, x: float, is_ai: bool = False):
         self.x = x
@@ -70,10 +161,12 @@ class Paddle:
         self.is_ai = is_ai
         self.speed = PADDLE_SPEED
         self.reaction_delay = 0
+        self.rect = pygame.Rect(int(self.x), int(self.y), PADDLE_WIDTH, PADDLE_HEIGHT)
     
     def get_rect(self) -> pygame.Rect:
-        """Get paddle rectangle for collision detection."""
-        return pygame.Rect(self.x, self.y, PADDLE_WIDTH, PADDLE_HEIGHT)
+        """Get the paddle's cached rectangle, moved to its current position, for drawing."""
+        self.rect.y = int(self.y)
+        return self.rect
     
     def move_up(self) -> None:
         """Move paddle up with boundary checking."""
@@ -84,12 +177,11 @@ class Paddle:
         self.y = min(SCREEN_HEIGHT - PADDLE_HEIGHT, self.y + self.speed)
     
     def ai_update(self, ball: Ball, ball_speed_multiplier: float) -> None:
-        """AI paddle update with realistic imperfections."""
-        if not self.is_ai:
-            return
+        """AI paddle update with realistic imperfections.
         
-        # AI only reacts when ball is moving toward it
-        if ball.vx < 0:
+        Callers only invoke this while the ball is moving toward the AI.
+        """
+        if not self.is_ai:
             return
         
         # Simulate reaction time
@@ -98,19 +190,12 @@ class Paddle:
             return
         self.reaction_delay = 0
         
-        # AI target with some inaccuracy
-        target_y = ball.y - PADDLE_HEIGHT // 2
-        error = random.gauss(0, 10)  # Small random error
-        target_y += error
-        
-        # Adjust speed based on ball speed
-        current_speed = self.speed * ball_speed_multiplier * random.uniform(0.9, 1.1)
-        
-        # Move toward target
-        if self.y < target_y - 5:
-            self.y = min(SCREEN_HEIGHT - PADDLE_HEIGHT, self.y + current_speed)
-        elif self.y > target_y + 5:
-            self.y = max(0, self.y - current_speed)
+        # Move toward the ball with a small random aiming error and a speed
+        # scaled by ball speed (+/-10%); the arithmetic lives in _ai_step
+        error = _RNG.gauss(0, 10)
+        scale = 0.9 + 0.2 * _RNG.random()
+        self.y = _ai_step(float(self.y), float(ball.y), self.speed * ball_speed_multiplier,
+                          error, scale)
 
 
 class Game:
@@ -120,10 +205,41 @@ class Game:
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Pong - Player vs Computer")
-        self.clock = pygame.time.Clock()
+        # Only quit, key presses and repaint triggers are handled; drop
+        # everything else (mouse motion, key releases, ...) before it
+        # reaches the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_ALLOWED_EVENTS)
+        self._frame_time = 1 / FPS
+        self._next_frame = 0.0
         self.font_large = pygame.font.Font(None, 74)
         self.font_medium = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 36)
+        self._text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]],
+                               pygame.Surface] = {}
+        
+        # Pre-render the dashed center line once; it never changes
+        self._centerline = pygame.Surface((4, SCREEN_HEIGHT)).convert()
+        self._centerline.fill(BLACK)
+        for y in range(0, SCREEN_HEIGHT, 20):
+            pygame.draw.rect(self._centerline, GRAY, (0, y, 4, 10))
+        
+        # Solid paddle/ball sprites: blitting these is cheaper than rasterizing rects
+        self._paddle_surf = pygame.Surface((PADDLE_WIDTH, PADDLE_HEIGHT)).convert()
+        self._paddle_surf.fill(WHITE)
+        self._ball_surf = pygame.Surface((BALL_SIZE, BALL_SIZE)).convert()
+        self._ball_surf.fill(WHITE)
+        
+        # Game over overlay and its text never change between frames
+        self._game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._game_over_overlay.set_alpha(180)
+        self._game_over_overlay.fill(BLACK)
+        self._game_over_text = self.font_large.render("GAME OVER", True, WHITE)
+        self._winner_texts = {
+            winner: self.font_medium.render(f"{winner} Wins!", True, WHITE)
+            for winner in ("Player", "Computer")
+        }
+        self._restart_text = self.font_small.render("Press R to restart, Q to quit", True, GRAY)
         
         self.reset_game()
     
@@ -132,7 +248,7 @@ class Game:
         self.player_paddle = Paddle(20, is_ai=False)
         self.ai_paddle = Paddle(SCREEN_WIDTH - 35, is_ai=True)
         self.ball = Ball(SCREEN_WIDTH//2, SCREEN_HEIGHT//2, 0, 0)
-        self.ball.reset(direction=random.choice([-1, 1]))
+        self.ball.reset(direction=(-1, 1)[_RNG.randrange(2)])
         
         self.player_score = 0
         self.ai_score = 0
@@ -140,48 +256,73 @@ class Game:
         self.game_over = False
         self.winner = None
         self.paused = False
+        
+        self._render_scores()
+        self._prev_dirty = []
+        self._full_redraw = True
+    
+    def _render_text(self, font: pygame.font.Font, text: str,
+                     color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render text once per (font, text, color) and reuse the surface."""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self._text_cache[key] = font.render(text, True, color)
+        return surface
+    
+    def _render_scores(self) -> None:
+        """Re-render the cached score surfaces; only needed when a score changes."""
+        self._player_text = self._render_text(self.font_large, str(self.player_score), WHITE)
+        self._player_text_x = SCREEN_WIDTH//4 - self._player_text.get_width()//2
+        self._ai_text = self._render_text(self.font_large, str(self.ai_score), WHITE)
+        self._ai_text_x = 3*SCREEN_WIDTH//4 - self._ai_text.get_width()//2
     
     def update(self) -> None:
         """Update game state for one frame."""
         if self.game_over or self.paused:
             return
         
-        # Update AI paddle
-        self.ai_paddle.ai_update(self.ball, self.ball_speed_multiplier)
-        
-        # Move ball
-        self.ball.move()
-        
-        # Ball collision with top/bottom walls
-        if self.ball.y - BALL_SIZE//2 <= 0 or self.ball.y + BALL_SIZE//2 >= SCREEN_HEIGHT:
-            self.ball.vy *= -1
-            self.ball.y = max(BALL_SIZE//2, min(SCREEN_HEIGHT - BALL_SIZE//2, self.ball.y))
+        ball = self.ball
         
-        # Ball collision with player paddle
-        player_rect = self.player_paddle.get_rect()
-        ball_rect = self.ball.get_rect()
+        # Update AI paddle; it only reacts when the ball is moving toward it
+        if ball.vx_q > 0:
+            self.ai_paddle.ai_update(ball, self.ball_speed_multiplier)
         
-        if ball_rect.colliderect(player_rect) and self.ball.vx < 0:
-            self._handle_paddle_hit(self.player_paddle)
+        # Move ball, bounce off walls, then test the paddle and goals in one
+        # pass over local copies of the fixed-point state
+        vx_q, vy_q = ball.vx_q, ball.vy_q
+        x_q = ball.x_q + vx_q
+        y_q = ball.y_q + vy_q
         
-        # Ball collision with AI paddle
-        ai_rect = self.ai_paddle.get_rect()
-        if ball_rect.colliderect(ai_rect) and self.ball.vx > 0:
-            self._handle_paddle_hit(self.ai_paddle)
+        # Ball collision with top/bottom walls: reflect the overshoot
+        if y_q < BALL_MIN_Y_Q:
+            y_q = 2*BALL_MIN_Y_Q - y_q
+            vy_q = -vy_q
+        elif y_q > BALL_MAX_Y_Q:
+            y_q = 2*BALL_MAX_Y_Q - y_q
+            vy_q = -vy_q
+        ball.x_q, ball.y_q, ball.vy_q = x_q, y_q, vy_q
         
-        # Score detection
-        if self.ball.x < 0:
+        # Ball collision with the paddle it is moving toward (inline AABB),
+        # otherwise score detection
+        bx, by = x_q >> FIXED_SHIFT, y_q >> FIXED_SHIFT
+        half = BALL_SIZE * 0.5
+        paddle = self.player_paddle if vx_q < 0 else self.ai_paddle
+        if (bx - half <= paddle.x + PADDLE_WIDTH and bx + half >= paddle.x
+                and by + half >= paddle.y and by - half <= paddle.y + PADDLE_HEIGHT):
+            self._handle_paddle_hit(paddle)
+        elif bx < 0:
             self._score_point(ai_wins=True)  # Ball passed player (left side), AI scores
-        elif self.ball.x > SCREEN_WIDTH:
+        elif bx > SCREEN_WIDTH:
             self._score_point(ai_wins=False)  # Ball passed AI (right side), player scores
     
     def _handle_paddle_hit(self, paddle: Paddle) -> None:
         """Handle ball hitting a paddle with physics."""
         # Reverse horizontal direction
-        self.ball.vx *= -1
+        self.ball.vx_q = -self.ball.vx_q
         
-        # Add "spin" based on where ball hit paddle
-        hit_pos = (self.ball.y - paddle.y) / PADDLE_HEIGHT
+        # Add "spin" based on where ball hit paddle (raw y keeps sub-pixel precision)
+        hit_pos = (self.ball.y_q / FIXED_ONE - paddle.y) / PADDLE_HEIGHT
         self.ball.vy += (hit_pos - 0.5) * 4
         
         # Increase speed gradually
@@ -203,6 +344,7 @@ class Game:
         else:
             self.player_score += 1
             self.ball.reset(direction=1)
+        self._render_scores()
         
         # Check for winner
         if self.player_score >= WINNING_SCORE:
@@ -214,29 +356,35 @@ class Game:
     
     def draw(self) -> None:
         """Render the game frame."""
-        self.screen.fill(BLACK)
-        
-        # Draw center line
-        for y in range(0, SCREEN_HEIGHT, 20):
-            pygame.draw.rect(self.screen, GRAY, (SCREEN_WIDTH//2 - 2, y, 4, 10))
+        # Overlay frames (and the first frame after one) change the whole
+        # screen; otherwise only erase and present what moved.
+        full_redraw = self.game_over or self.paused or self._full_redraw
+        if full_redraw:
+            self.screen.fill(BLACK)
+        else:
+            for rect in self._prev_dirty:
+                self.screen.fill(BLACK, rect)
         
-        # Draw paddles
-        pygame.draw.rect(self.screen, WHITE, self.player_paddle.get_rect())
-        pygame.draw.rect(self.screen, WHITE, self.ai_paddle.get_rect())
+        # Draw center line (cheap, and restores dashes erased above)
+        self.screen.blit(self._centerline, (SCREEN_WIDTH//2 - 2, 0))
         
-        # Draw ball
-        pygame.draw.rect(self.screen, WHITE, self.ball.get_rect())
+        # Draw paddles and ball, remembering the area each one covers
+        dirty = [
+            self.screen.blit(self._paddle_surf, self.player_paddle.get_rect()),
+            self.screen.blit(self._paddle_surf, self.ai_paddle.get_rect()),
+            self.screen.blit(self._ball_surf, self.ball.get_rect()),
+        ]
         
         # Draw scores
-        player_text = self.font_large.render(str(self.player_score), True, WHITE)
-        ai_text = self.font_large.render(str(self.ai_score), True, WHITE)
-        self.screen.blit(player_text, (SCREEN_WIDTH//4 - player_text.get_width()//2, 20))
-        self.screen.blit(ai_text, (3*SCREEN_WIDTH//4 - ai_text.get_width()//2, 20))
+        dirty.append(self.screen.blit(self._player_text, (self._player_text_x, 20)))
+        dirty.append(self.screen.blit(self._ai_text, (self._ai_text_x, 20)))
         
         # Draw speed indicator
         if not self.game_over:
-            speed_text = self.font_small.render(f"Speed: {self.ball_speed_multiplier:.1f}x", True, GRAY)
-            self.screen.blit(speed_text, (SCREEN_WIDTH//2 - speed_text.get_width()//2, 60))
+            speed_text = self._render_text(
+                self.font_small, f"Speed: {self.ball_speed_multiplier:.1f}x", GRAY)
+            dirty.append(self.screen.blit(
+                speed_text, (SCREEN_WIDTH//2 - speed_text.get_width()//2, 60)))
         
         # Draw game over screen
         if self.game_over:
@@ -244,18 +392,20 @@ class Game:
         elif self.paused:
             self._draw_pause()
         
-        pygame.display.flip()
+        if full_redraw:
+            pygame.display.flip()
+            self._full_redraw = self.game_over or self.paused
+        else:
+            pygame.display.update(self._prev_dirty + dirty)
+        self._prev_dirty = dirty
     
     def _draw_game_over(self) -> None:
         """Render game over overlay."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._game_over_overlay, (0, 0))
         
-        game_over_text = self.font_large.render("GAME OVER", True, WHITE)
-        winner_text = self.font_medium.render(f"{self.winner} Wins!", True, WHITE)
-        restart_text = self.font_small.render("Press R to restart, Q to quit", True, GRAY)
+        game_over_text = self._game_over_text
+        winner_text = self._winner_texts[self.winner]
+        restart_text = self._restart_text
         
         self.screen.blit(game_over_text, 
                         (SCREEN_WIDTH//2 - game_over_text.get_width()//2, SCREEN_HEIGHT//2 - 80))
@@ -266,8 +416,8 @@ class Game:
     
     def _draw_pause(self) -> None:
         """Render pause overlay."""
-        pause_text = self.font_large.render("PAUSED", True, WHITE)
-        hint_text = self.font_small.render("Press P to resume", True, GRAY)
+        pause_text = self._render_text(self.font_large, "PAUSED", WHITE)
+        hint_text = self._render_text(self.font_small, "Press P to resume", GRAY)
         self.screen.blit(pause_text, 
                         (SCREEN_WIDTH//2 - pause_text.get_width()//2, SCREEN_HEIGHT//2 - 40))
         self.screen.blit(hint_text, 
@@ -275,23 +425,30 @@ class Game:
     
     def handle_input(self) -> bool:
         """Process input events. Returns False to quit."""
+        # Blocking in __init__ already limits the queue to _ALLOWED_EVENTS
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            event_type = event.type
+            if event_type == QUIT:
                 return False
             
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_q:
+            if event_type in _REDRAW_EVENTS:
+                self._full_redraw = True
+                continue
+            
+            if event_type == KEYDOWN:
+                key = event.key
+                if key == K_q:
                     return False
-                elif event.key == pygame.K_r:
+                elif key == K_r:
                     self.reset_game()
-                elif event.key == pygame.K_p:
+                elif key == K_p:
                     self.paused = not self.paused
         
-        # Continuous key presses for paddle movement
+        # Continuous key presses for paddle movement (read after the event pump)
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
+        if keys[K_UP] or keys[K_w]:
             self.player_paddle.move_up()
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        if keys[K_DOWN] or keys[K_s]:
             self.player_paddle.move_down()
         
         return True
@@ -299,13 +456,29 @@ class Game:
     def run(self) -> None:
         """Main game loop."""
         running = True
+        self._next_frame = time.monotonic()
         while running:
             running = self.handle_input()
             self.update()
             self.draw()
-            self.clock.tick(FPS)
+            self._wait_for_next_frame()
         
         pygame.quit()
+    
+    def _wait_for_next_frame(self) -> None:
+        """Sleep until the next frame deadline on the monotonic clock.
+        
+        Deadlines advance by a fixed step, so sleep overshoot on one frame
+        is absorbed by a shorter sleep on the next instead of accumulating.
+        """
+        self._next_frame += self._frame_time
+        delay = self._next_frame - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        elif delay < -self._frame_time:
+            # Fell more than a frame behind (e.g. window dragged); resync
+            # rather than running a burst of catch-up frames
+            self._next_frame = time.monotonic()
 
 
 def main() -> None: